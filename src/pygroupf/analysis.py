@@ -1,10 +1,199 @@
+import numpy as np
 import pandas as pd
 
+# Largest integer key for which dict rules are scored with a lookup table
+_MAX_LOOKUP_SIZE = 1024
+
+
+def _column_values(series):
+    """
+    Return the raw values of a column for the column scorers.
+
+    Args:
+        series (pd.Series): Column to extract.
+
+    Returns:
+        np.ndarray or pd.Categorical: The values as a NumPy array, except for
+        categorical columns, which keep their codes and categories.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.array
+    return series.to_numpy()
+
+
+def _apply_unique(values, func):
+    """
+    Apply a scalar function to an array, calling it once per distinct value.
+
+    Categorical values are scored once per category and looked up by code,
+    without factorizing them again.
+
+    Args:
+        values (np.ndarray or pd.Categorical): Column values to evaluate.
+        func: Scalar function taking a single value.
+
+    Returns:
+        np.ndarray: Results aligned with the input values.
+    """
+    if isinstance(values, pd.Categorical):
+        codes, uniques = values.codes, values.categories
+    else:
+        codes, uniques = pd.factorize(values)
+
+    # Pass Python ints so downcast integer columns cannot overflow in rules
+    if uniques.dtype.kind in "iu":
+        uniques = uniques.tolist()
+    results = [func(value) for value in uniques]
+
+    # factorize marks missing values with -1, which picks the last slot
+    missing = codes == -1
+    results.append(func(values[missing][0]) if missing.any() else 0)
+    return np.asarray(results)[codes]
+
+
+def _build_lookup_table(mapping):
+    """
+    Build a dense score array indexed by the keys of a value mapping.
+
+    Args:
+        mapping: Dictionary of value to score.
+
+    Returns:
+        np.ndarray or None: Scores at their key positions (0 elsewhere), or
+        None if the keys are not small non-negative integers.
+    """
+    # bool is an int subclass, but True/False keys are not table positions
+    keys = list(mapping)
+    if not keys or not all(
+        isinstance(key, (int, np.integer))
+        and not isinstance(key, bool)
+        and 0 <= key < _MAX_LOOKUP_SIZE
+        for key in keys
+    ):
+        return None
+
+    scores = np.asarray(list(mapping.values()))
+    if scores.dtype.kind not in "iuf":
+        return None
+
+    lookup = np.zeros(max(keys) + 1, dtype=scores.dtype)
+    lookup[keys] = scores
+    return lookup
+
+
+def _compile_value_rules(rules):
+    """
+    Build a scalar scoring function for a single field.
+
+    Args:
+        rules: Scoring rules configured for the field.
+
+    Returns:
+        callable: Function taking a field value and returning its score.
+    """
+
+    # Handle numeric range rules (for continuous variables like age/amount)
+    if isinstance(rules, list):
+
+        def score_ranges(value):
+            for rule in rules:
+                if "condition" in rule and rule["condition"](value):
+                    return rule["score"]
+                elif "threshold" in rule and value > rule["threshold"]:
+                    return rule["score"]
+            return 0
+
+        return score_ranges
+
+    # Handle categorical fields with default/specific scoring
+    elif isinstance(rules, dict) and "default" in rules:
+        default = rules["default"]
+        specific = rules.get("specific", {})
+        fallback = specific.get(0, 0)
+
+        def score_default(value):
+            if value in specific:
+                return specific[value]
+            try:
+                return default(value)
+            except (TypeError, KeyError):
+                return fallback
+
+        return score_default
+
+    # Handle simple value mappings (for discrete categories)
+    elif isinstance(rules, dict):
+        return lambda value: rules.get(value, 0)
+
+    return lambda value: 0
+
+
+def _compile_column_rules(rules):
+    """
+    Build a column-wise scoring function for a single field.
+
+    Args:
+        rules: Scoring rules configured for the field.
+
+    Returns:
+        callable: Function taking the field's column as a NumPy array and
+        returning an array of scores.
+    """
+
+    # Numeric range rules with conditions: the conditions are arbitrary
+    # callables, so factorize the column once and run the whole ladder per
+    # distinct value
+    if isinstance(rules, list) and any("condition" in rule for rule in rules):
+        score_value = _compile_value_rules(rules)
+        return lambda col: _apply_unique(col, score_value)
+
+    # Numeric threshold rules: the first exceeded threshold wins, as in
+    # np.select
+    elif isinstance(rules, list):
+        thresholds = [rule["threshold"] for rule in rules if "threshold" in rule]
+        choices = [rule["score"] for rule in rules if "threshold" in rule]
+
+        def score_thresholds(col):
+            if not thresholds:
+                return np.zeros(len(col), dtype=int)
+            col = np.asarray(col)
+            conditions = [col > threshold for threshold in thresholds]
+            return np.select(conditions, choices, default=0)
+
+        return score_thresholds
+
+    # Simple value mappings over small integer codes: index a dense lookup
+    # table with the column values directly
+    elif isinstance(rules, dict) and "default" not in rules:
+        score_value = _compile_value_rules(rules)
+        lookup = _build_lookup_table(rules)
+        if lookup is None:
+            return lambda col: _apply_unique(col, score_value)
+
+        def score_lookup(col):
+            if col.dtype.kind not in "iu":
+                return _apply_unique(col, score_value)
+            in_table = (col >= 0) & (col < len(lookup))
+            return np.where(in_table, lookup[np.where(in_table, col, 0)], 0)
+
+        return score_lookup
+
+    # Categorical fields with default/specific scoring: score each distinct
+    # value once instead of once per row
+    elif isinstance(rules, dict):
+        score_value = _compile_value_rules(rules)
+        return lambda col: _apply_unique(col, score_value)
+
+    return lambda col: np.zeros(len(col), dtype=int)
+
 
 class DataAnalyzer:
     """
     Analyzes credit data to calculate risk scores and levels using configurable rules.
 
+    The rules and levels are compiled when assigned, so reassign scoring_rules
+    or risk_levels to change them; editing the dicts in place is not seen.
+
     Attributes:
         data (pd.DataFrame): Processed credit data with required fields.
         scoring_rules (dict): Field-specific scoring rules configuration.
@@ -21,12 +210,61 @@ class DataAnalyzer:
             risk_levels: List of (threshold, level_name) tuples in descending order.
         """
         assert isinstance(data, pd.DataFrame), "data must be a DataFrame"
-        assert isinstance(scoring_rules, dict), "scoring_rules must be a dict"
-        assert len(risk_levels) > 0, "risk_levels cannot be empty"
 
         self.data = data
         self.scoring_rules = scoring_rules
-        self.risk_levels = sorted(risk_levels, key=lambda x: x[0], reverse=True)
+        self.risk_levels = risk_levels
+
+    @property
+    def scoring_rules(self):
+        """dict: Field-specific scoring rules; assigning recompiles them."""
+        return self._scoring_rules
+
+    @scoring_rules.setter
+    def scoring_rules(self, scoring_rules):
+        assert isinstance(scoring_rules, dict), "scoring_rules must be a dict"
+        self._scoring_rules = scoring_rules
+
+        # Data column holding each scored field, normalized once
+        self._column_names = {
+            field_name: field_name.lower().replace(" ", "_")
+            for field_name in scoring_rules
+        }
+
+        # Compile the rules once so scoring skips the rule-type dispatch
+        self._value_fns = {
+            field_name: _compile_value_rules(rules)
+            for field_name, rules in scoring_rules.items()
+        }
+        self._field_fns = {
+            field_name: _compile_column_rules(rules)
+            for field_name, rules in scoring_rules.items()
+        }
+
+    @property
+    def risk_levels(self):
+        """list: (threshold, level_name) tuples, highest threshold first."""
+        return self._risk_levels
+
+    @risk_levels.setter
+    def risk_levels(self, risk_levels):
+        assert len(risk_levels) > 0, "risk_levels cannot be empty"
+        self._risk_levels = sorted(risk_levels, key=lambda x: x[0], reverse=True)
+
+        # Ascending thresholds for np.searchsorted, with 'Unknown' in the last
+        # slot for scores below the lowest threshold; labels stay objects so
+        # non-string level names are returned unchanged
+        ascending_levels = self._risk_levels[::-1]
+        self._thresholds = np.array([threshold for threshold, _ in ascending_levels])
+        self._labels = np.array(
+            [level for _, level in ascending_levels] + ["Unknown"], dtype=object
+        )
+
+        # One fixed categorical dtype for risk_level, so reports from the same
+        # configuration share their categories (and concatenate as categoricals)
+        self._level_dtype = pd.CategoricalDtype(
+            list(dict.fromkeys([level for _, level in self._risk_levels] + ["Unknown"]))
+        )
 
     def calculate_field_score(self, field_name, value):
         """
@@ -39,31 +277,8 @@ class DataAnalyzer:
         Returns:
             int: Calculated score (0 if no rule matches).
         """
-        rules = self.scoring_rules.get(field_name, {})
-
-        # Handle numeric range rules (for continuous variables like age/amount)
-        if isinstance(rules, list):
-            for rule in rules:
-                if "condition" in rule and rule["condition"](value):
-                    return rule["score"]
-                elif "threshold" in rule and value > rule["threshold"]:
-                    return rule["score"]
-            return 0
-
-        # Handle categorical fields with default/specific scoring
-        elif isinstance(rules, dict) and "default" in rules:
-            if value in rules.get("specific", {}):
-                return rules["specific"][value]
-            try:
-                return rules["default"](value)
-            except (TypeError, KeyError):
-                return rules.get("specific", {}).get(0, 0)
-
-        # Handle simple value mappings (for discrete categories)
-        elif isinstance(rules, dict):
-            return rules.get(value, 0)
-
-        return 0
+        score_value = self._value_fns.get(field_name)
+        return score_value(value) if score_value is not None else 0
 
     def calculate_risk_score(self, row):
         """
@@ -75,14 +290,11 @@ class DataAnalyzer:
         Returns:
             int: Total score clamped to 0-100 range.
         """
-        assert not row.empty, "Row data cannot be empty"
-
         score = 0
 
         # Sum scores for all configured fields
-        for field_name in self.scoring_rules:
-            normalized_name = field_name.lower().replace(" ", "_")
-            score += self.calculate_field_score(field_name, row[normalized_name])
+        for field_name, score_value in self._value_fns.items():
+            score += score_value(row[self._column_names[field_name]])
 
         # Ensure final score stays within bounds
         return min(max(score, 0), 100)
@@ -97,13 +309,23 @@ class DataAnalyzer:
         Returns:
             str: Risk level name or 'Unknown' if no match.
         """
-        assert 0 <= score <= 100, "Score must be between 0-100"
+        return self._classify_scores(np.asarray([score])).item()
 
-        # Check thresholds in descending order (highest risk first)
-        for threshold, level in self.risk_levels:
-            if score >= threshold:
-                return level
-        return "Unknown"
+    def _classify_scores(self, scores):
+        """
+        Classify an array of scores into risk levels in a single pass.
+
+        Args:
+            scores (np.ndarray): Calculated risk scores.
+
+        Returns:
+            np.ndarray: Risk level names, 'Unknown' where no threshold is reached.
+        """
+        # Find the highest threshold each score reaches; scores below the
+        # lowest threshold (or NaN) take the 'Unknown' slot
+        level_idx = np.searchsorted(self._thresholds, scores, side="right") - 1
+        level_idx[~(scores >= self._thresholds[0])] = len(self._labels) - 1
+        return self._labels[level_idx]
 
     def generate_risk_report(self):
         """
@@ -113,32 +335,61 @@ class DataAnalyzer:
             pd.DataFrame: Report with original data plus risk analysis columns.
         """
         assert not self.data.empty, "Data cannot be empty"
+        missing_cols = [
+            field_name
+            for field_name, column in self._column_names.items()
+            if column not in self.data.columns
+        ]
+        assert not missing_cols, f"Data is missing scored fields: {missing_cols}"
 
-        report_df = self.data
+        # Work on a shallow copy so the analyzer's data is left untouched
+        report_df = self.data.copy(deep=False)
 
-        # Add sequential customer ID based on DataFrame index
-        report_df["customer_id"] = report_df.index + 1
+        # Add sequential customer ID based on DataFrame index as first column
+        if "customer_id" in report_df.columns:
+            report_df = report_df.drop(columns="customer_id")
+        report_df.insert(
+            0, "customer_id", np.asarray(report_df.index + 1, dtype=np.int32)
+        )
 
-        # Calculate risk metrics
-        report_df["risk_score"] = report_df.apply(self.calculate_risk_score, axis=1)
-        report_df["risk_level"] = report_df["risk_score"].apply(
-            self.determine_risk_level
+        # Score each field over its raw column array, then clamp to 0-100
+        total = np.zeros(len(report_df), dtype=int)
+        for field_name, score_column in self._field_fns.items():
+            column = report_df[self._column_names[field_name]]
+            total = total + score_column(_column_values(column))
+        # Store whole-number scores as int64 rather than downcasting, so
+        # arithmetic on them cannot overflow; rules evaluated on float columns
+        # (e.g. with NaNs) give float sums that are usually whole as well
+        total = np.clip(total, 0, 100)
+        if total.dtype.kind == "f" and np.array_equal(total, np.round(total)):
+            total = total.astype(np.int64)
+        report_df["risk_score"] = total
+
+        # Store levels as a categorical: a handful of labels plus small codes
+        report_df["risk_level"] = pd.Categorical(
+            self._classify_scores(report_df["risk_score"].to_numpy()),
+            dtype=self._level_dtype,
         )
 
-        cols = ["customer_id"] + [
-            col for col in report_df.columns if col != "customer_id"
-        ]
-        return report_df[cols]
+        return report_df
 
     def save_risk_report(self, output_path="data/risk_report.csv"):
         """
-        Save risk report to CSV file.
+        Save risk report to a CSV or Parquet file.
+
+        Paths ending in '.parquet' are written as zstd-compressed Parquet
+        (requires pyarrow), which skips CSV text formatting entirely.
 
         Args:
             output_path: File path to save report (default: 'risk_report.csv').
         """
-        assert output_path.endswith(".csv"), "Output path must be a CSV file"
+        assert output_path.endswith(
+            (".csv", ".parquet")
+        ), "Output path must be a CSV or Parquet file"
 
         report_df = self.generate_risk_report()
-        report_df.to_csv(output_path, index=False)
+        if output_path.endswith(".parquet"):
+            report_df.to_parquet(output_path, compression="zstd", index=False)
+        else:
+            report_df.to_csv(output_path, index=False)
         print(f"Risk report saved to {output_path}")
@@ -1,67 +1,232 @@
+import csv
+import numpy as np
 import pandas as pd
 import os
 
+# pyarrow is optional: it enables the multithreaded CSV parser and Parquet
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+# read_csv(engine="pyarrow") needs pandas 1.4 or later
+_PYARROW_CSV = pyarrow is not None and tuple(
+    int(part) for part in pd.__version__.split(".")[:2]
+) >= (1, 4)
+
+# Errors that can stop a DataFrame from being written as Parquet
+if pyarrow is not None:
+    _PARQUET_ERRORS = (ImportError, ValueError, TypeError, pyarrow.lib.ArrowException)
+else:
+    _PARQUET_ERRORS = (ImportError, ValueError, TypeError)
+
+# Compact dtypes for the integer columns of the German credit data, with
+# headroom so derived features (e.g. credit_amount * duration, age * age) do
+# not overflow; pass as clean_data(..., dtypes=CREDIT_DTYPES)
+CREDIT_DTYPES = {
+    "age": "int16",
+    "job": "int16",
+    "duration": "int16",
+    "credit_amount": "int32",
+}
+
+
+def _parquet_path(csv_path):
+    """Return the path of the Parquet copy kept next to a CSV file."""
+    return os.path.splitext(csv_path)[0] + ".parquet"
+
+
+def _fresh_parquet_path(csv_path):
+    """Return the Parquet copy of a CSV file if it is at least as new, else None."""
+    if pyarrow is None:
+        return None
+
+    parquet_path = _parquet_path(csv_path)
+    try:
+        if os.stat(parquet_path).st_mtime >= os.stat(csv_path).st_mtime:
+            return parquet_path
+    except OSError:
+        pass
+    return None
+
+
+def _write_parquet_copy(data, parquet_path):
+    """Write the Parquet copy of a saved CSV, removing any stale copy on failure."""
+    try:
+        data.to_parquet(parquet_path, compression="zstd", index=False)
+    except _PARQUET_ERRORS:
+        # e.g. mixed-type object columns; load_data then falls back to the CSV
+        try:
+            os.remove(parquet_path)
+        except OSError:
+            pass
+
+
+def _csv_header(csv_path):
+    """
+    Read the raw header line of a plain local CSV file.
+
+    Only local '.csv' files are sniffed, so URLs and compressed files are not
+    opened twice.
+
+    Args:
+        csv_path (str): Path to the CSV file.
+
+    Returns:
+        list or None: The column names as written in the file, or None if the
+        file was not sniffed.
+    """
+    if not csv_path.endswith(".csv") or not os.path.isfile(csv_path):
+        return None
+    try:
+        with open(csv_path, newline="", encoding="utf-8-sig") as f:
+            return next(csv.reader(f), [])
+    except (OSError, UnicodeDecodeError, csv.Error):
+        return None
+
 
-def load_data(file_path):
+def load_data(file_path, dtype=None):
     """
     Load the dataset from the specified file path and perform initial formatting.
 
+    If a Parquet copy written by save_processed_data exists next to the CSV
+    and is newer than it, the Parquet file is read instead. Paths ending in
+    '.parquet' are read as Parquet directly. Parquet files keep their stored
+    dtypes, so `dtype` is ignored whenever a Parquet file is read.
+
+    CSV paths are parsed with the pyarrow engine when pyarrow is installed,
+    which infers more types than the C parser: ISO dates such as 2020-01-01
+    become datetime.date objects and timestamps become datetime64 columns.
+    Pass `dtype` (e.g. {'Date': str}) to keep such columns as strings.
+
     Args:
-        file_path (str): Path to the CSV file containing the data.
+        file_path (str, os.PathLike or file-like): Path to the CSV (or Parquet)
+                                                   file containing the data, or
+                                                   an open CSV buffer.
+        dtype (dict, optional): Column dtypes keyed by the raw CSV column names,
+                                passed to pd.read_csv to skip type inference
+                                (ignored when reading Parquet).
 
     Returns:
         pd.DataFrame: The raw loaded data with standardized column names.
     """
-    data = pd.read_csv(file_path)
-
-    # Remove unnamed index column if exists
-    if data.columns[0].startswith("Unnamed"):
-        data = data.drop(data.columns[0], axis=1)
+    if not isinstance(file_path, (str, os.PathLike)):
+        # File-like objects are read as they are: sniffing their header first
+        # would consume the buffer before the real read
+        data = pd.read_csv(file_path, dtype=dtype)
+    else:
+        file_path = os.fspath(file_path)
+        if file_path.endswith(".parquet"):
+            parquet_path = file_path
+        else:
+            parquet_path = _fresh_parquet_path(file_path)
+
+        if parquet_path is not None:
+            data = pd.read_parquet(parquet_path)
+        else:
+            header = _csv_header(file_path)
+            engine = "pyarrow" if _PYARROW_CSV else "c"
+            usecols = None
+            if header is not None and len(set(header)) < len(header):
+                # Only the C parser renames repeated names (a, a.1, ...)
+                engine = "c"
+            elif (
+                header is not None
+                and len(header) > 1
+                and not header[0].strip()
+                and all(name.strip() for name in header[1:])
+            ):
+                # Skip a blank-named index column while parsing rather than
+                # dropping it (and copying the frame) afterwards
+                usecols = header[1:]
+            data = pd.read_csv(file_path, dtype=dtype, engine=engine, usecols=usecols)
+
+    # Remove unnamed index column if still present (pyarrow leaves it blank)
+    if data.columns[0] == "" or data.columns[0].startswith("Unnamed"):
+        data = data.iloc[:, 1:]
 
     # Standardize column names
-    data.columns = data.columns.str.lower().str.replace(" ", "_")
+    data.columns = [col.lower().replace(" ", "_") for col in data.columns]
 
     assert not data.empty, "Loaded DataFrame should not be empty"
     return data
 
 
-def clean_data(data, categorical_cols, numerical_cols):
+def clean_data(data, categorical_cols, numerical_cols, dtypes=None):
     """
     Clean and preprocess the dataset.
 
     Handles missing values differently for categorical and numerical columns:
-    - Categorical columns: Filled with 'unknown'
-    - Numerical columns: Converted to numeric type and filled with median
+    - Categorical columns: Filled with 'unknown' and stored as pandas 'category'
+    - Numerical columns: Converted to numeric type and filled with median,
+      then cast to the requested dtypes (other columns keep their dtype)
 
     Args:
         data (pd.DataFrame): The DataFrame to be cleaned.
         categorical_cols (list): List of column names to be treated as categorical.
         numerical_cols (list): List of column names to be treated as numerical.
+        dtypes (dict, optional): Target dtypes for numerical columns, e.g.
+                                 CREDIT_DTYPES or {'Credit amount': 'int32'}.
+                                 Integer values must fit the target dtype.
 
     Returns:
         pd.DataFrame: The cleaned DataFrame with no missing values.
     """
 
-    # Convert user-provided column names to internal format
-    categorical_cols = [col.lower().replace(" ", "_") for col in categorical_cols]
-    numerical_cols = [col.lower().replace(" ", "_") for col in numerical_cols]
-
-    # Process categorical columns
-    for col in categorical_cols:
-        if col in data.columns:
-            data[col] = data[col].fillna("unknown")
-            assert data[col].isna().sum() == 0, f"{col} still contains NA values"
-
-    # Process numerical columns
-    for col in numerical_cols:
-        if col in data.columns:
-            data[col] = pd.to_numeric(data[col], errors="coerce")
-            median_val = data[col].median()
-            data[col] = data[col].fillna(median_val)
-            assert data[col].isna().sum() == 0, f"{col} still contains NA values"
-            assert pd.api.types.is_numeric_dtype(
-                data[col]
-            ), f"{col} is not numeric after conversion"
+    # Convert user-provided column names to internal format, keeping only
+    # columns present in the data
+    categorical_cols = [
+        col
+        for col in dict.fromkeys(c.lower().replace(" ", "_") for c in categorical_cols)
+        if col in data.columns
+    ]
+    numerical_cols = [
+        col
+        for col in dict.fromkeys(c.lower().replace(" ", "_") for c in numerical_cols)
+        if col in data.columns
+    ]
+
+    # Convert numerical columns to numeric type as one block
+    fill_values = dict.fromkeys(categorical_cols, "unknown")
+    if numerical_cols:
+        numeric = data[numerical_cols].apply(pd.to_numeric, errors="coerce")
+        data[numerical_cols] = numeric
+        fill_values.update(numeric.median().to_dict())
+
+    # Fill categorical columns with 'unknown' and numerical columns with
+    # their median in a single pass
+    if fill_values:
+        data.fillna(fill_values, inplace=True)
+
+    if numerical_cols:
+        # Apply requested dtypes, refusing integer casts that would wrap
+        dtypes = {
+            col.lower().replace(" ", "_"): dtype
+            for col, dtype in (dtypes or {}).items()
+        }
+        dtypes = {col: dtypes[col] for col in numerical_cols if col in dtypes}
+        for col, dtype in dtypes.items():
+            dtype = pd.api.types.pandas_dtype(dtype)
+            if pd.api.types.is_integer_dtype(dtype):
+                limits = np.iinfo(getattr(dtype, "numpy_dtype", dtype))
+                assert (
+                    limits.min <= data[col].min() and data[col].max() <= limits.max
+                ), f"values of {col} do not fit in {dtype}"
+        if dtypes:
+            data[list(dtypes)] = data[list(dtypes)].astype(dtypes)
+        assert all(
+            pd.api.types.is_numeric_dtype(dtype)
+            for dtype in data[numerical_cols].dtypes
+        ), "numerical columns are not numeric after conversion"
+
+    assert (
+        not data[categorical_cols + numerical_cols].isna().any().any()
+    ), "cleaned columns still contain NA values"
+
+    # Store categorical columns as integer codes plus a small set of labels
+    categorical_only = [col for col in categorical_cols if col not in numerical_cols]
+    if categorical_only:
+        data[categorical_only] = data[categorical_only].astype("category")
 
     return data
 
@@ -70,6 +235,9 @@ class DataEncoder:
     """
     A class for encoding categorical columns in a DataFrame using specified numerical mappings.
 
+    The mapping is compiled when assigned, so reassign column_mapping to change
+    it; editing the dictionaries in place is not seen.
+
     Attributes:
         column_mapping (dict): Dictionary mapping column names to value dictionaries.
     """
@@ -84,6 +252,30 @@ class DataEncoder:
         """
         self.column_mapping = column_mapping
 
+    @property
+    def column_mapping(self):
+        """dict: Column to value mappings; assigning rebuilds the encoding tables."""
+        return self._column_mapping
+
+    @column_mapping.setter
+    def column_mapping(self, column_mapping):
+        self._column_mapping = column_mapping
+
+        # Convert the mapping keys to internal column name format once
+        self._internal_mapping = {
+            col.lower().replace(" ", "_"): value_map
+            for col, value_map in column_mapping.items()
+        }
+
+        # Split each mapping into a key index and an array of encoded values,
+        # so encoding is a single index lookup plus a gather
+        self._encoding_tables = {}
+        for col, value_map in self._internal_mapping.items():
+            values = np.asarray(list(value_map.values()))
+            if values.dtype.kind in "iu":
+                values = pd.to_numeric(values, downcast="integer")
+            self._encoding_tables[col] = (pd.Index(list(value_map)), values)
+
     def encode(self, data):
         """
         Encode categorical columns in the DataFrame using the specified numerical mappings.
@@ -95,28 +287,40 @@ class DataEncoder:
             pd.DataFrame: The DataFrame with encoded categorical values.
         """
 
-        # Convert the mapping keys to internal column name format
-        internal_mapping = {}
-        for col, value_map in self.column_mapping.items():
-            internal_col = col.lower().replace(" ", "_")
-            internal_mapping[internal_col] = value_map
-
-        # Apply the mapping to each column
-        for col, value_map in internal_mapping.items():
-            if col in data.columns:
-                data[col] = data[col].map(value_map)
+        # Encode all present columns, then write them back in one assignment
+        encoded = {}
+        for col, (keys, values) in self._encoding_tables.items():
+            if col not in data.columns:
+                continue
+            codes = keys.get_indexer(data[col])
+            if (codes < 0).any():
+                # Unmapped values become NaN, as with Series.map
+                encoded[col] = data[col].map(self._internal_mapping[col])
+            else:
+                encoded[col] = values[codes]
+        if encoded:
+            data[list(encoded)] = pd.DataFrame(encoded, index=data.index)
 
         return data
 
 
-def save_processed_data(data, output_dir="data", filename="processed_credit_data.csv"):
+def save_processed_data(
+    data, output_dir="data", filename="processed_credit_data.csv", file_format="csv"
+):
     """
-    Save the processed data to a CSV file.
+    Save the processed data to a CSV or Parquet file.
+
+    When saving CSV with pyarrow installed, a Parquet copy is written
+    alongside so that load_data can skip re-parsing the CSV. The copy is only
+    a cache: if the data cannot be stored as Parquet, it is skipped (and any
+    stale copy removed) and the CSV is saved as usual.
 
     Args:
         data (pd.DataFrame): The DataFrame to be saved.
         output_dir (str): Directory to save the processed data.
         filename (str): Name of the output file.
+        file_format (str): 'csv', or 'parquet' to write only a zstd-compressed
+                           Parquet file (the filename extension becomes '.parquet').
 
     Returns:
         str: Path where the file was saved.
@@ -125,9 +329,17 @@ def save_processed_data(data, output_dir="data", filename="processed_credit_data
     # Create output directory if it doesn't exist
     os.makedirs(output_dir, exist_ok=True)
 
-    # Save processed data to CSV
+    assert file_format in ("csv", "parquet"), "file_format must be 'csv' or 'parquet'"
+
+    # Save processed data to CSV, or straight to Parquet
     output_path = os.path.join(output_dir, filename)
-    data.to_csv(output_path, index=False)
+    if file_format == "parquet":
+        output_path = _parquet_path(output_path)
+        data.to_parquet(output_path, compression="zstd", index=False)
+    else:
+        data.to_csv(output_path, index=False)
+        if pyarrow is not None:
+            _write_parquet_copy(data, _parquet_path(output_path))
     print(f"Data processing completed successfully! File saved to {output_path}")
 
     return output_path
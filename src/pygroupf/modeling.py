@@ -5,64 +5,71 @@ This script reads processed credit data, applies one-hot encoding,
 creates a target column, splits the data into training and test sets,
 performs hyperparameter tuning using GridSearchCV, trains a Random Forest model,
 and evaluates the model's performance using accuracy, confusion matrix, and F2-score.
+
+Importing this module only defines the modeling functions; the full pipeline
+runs through main(), either with `python -m pygroupf.modeling` or as a script
+with `python src/pygroupf/modeling.py`. The trained model is saved with joblib
+together with a hash of the training data and grid it was tuned on, and
+reused only while those (and the scikit-learn version) match.
 """
 
+import os
+import pickle
+
+import joblib
+import numpy as np
 import pandas as pd
+import sklearn
 from sklearn.model_selection import train_test_split, GridSearchCV
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import accuracy_score, confusion_matrix, fbeta_score
 
-# Read data
-data = pd.read_csv("data/processed_credit_data.csv")
-print("Columns in dataset:", data.columns)  # Print column names for verification
+try:
+    from .data_processing import load_data
+except ImportError:
+    # Run as a plain script (python src/pygroupf/modeling.py), outside the package
+    from data_processing import load_data
 
-# One-Hot Encoding of Categorical Features
-categorical_columns = [
+# Categorical features to one-hot encode
+CATEGORICAL_COLUMNS = [
     "sex",
     "housing",
     "saving_accounts",
     "checking_account",
     "purpose",
 ]
-data = pd.get_dummies(
-    data, columns=categorical_columns, drop_first=True
-)  # Prevent dummy variable trap
-
-
-# Creating Target Column
-def create_target_column(df):
-    """Creates a binary target column 'good_credit' based on credit amount and age."""
-    df["good_credit"] = ((df["credit_amount"] > 10000) & (df["age"] > 30)).astype(int)
-    return df
-
 
-data = create_target_column(data)
-
-# Splitting dataset into features (X) and target (y)
-X = data.drop(columns=["good_credit"])  # Feature matrix
-y = data["good_credit"]  # Target column
-
-# Split the dataset into training and test sets
-X_train, X_test, y_train, y_test = train_test_split(
-    X, y, test_size=0.2, random_state=42
-)
-
-# Setting the Hyperparameter Grid
-param_grid = {
+# Hyperparameter grid for the Random Forest
+PARAM_GRID = {
     "max_depth": [3, 5, 7, 10, None],
     "n_estimators": [3, 5, 10, 25, 50, 150],
     "max_features": [4, 7, 15, 20],
 }
 
-# Creating a Random Forest Classifier
-model = RandomForestClassifier(random_state=2)
+# Where the tuned Random Forest is cached between runs
+MODEL_PATH = "data/rf_model.joblib"
+
+
+# Creating Target Column
+def create_target_column(df):
+    """
+    Creates a binary (int8) target column 'good_credit' based on credit amount
+    and age.
+    """
+    df["good_credit"] = ((df["credit_amount"] > 10000) & (df["age"] > 30)).astype(
+        np.int8
+    )
+    return df
 
 
 # Hyperparameter tuning using GridSearchCV
 def tune_hyperparameters(model, param_grid, X_train, y_train):
-    """Performs hyperparameter tuning using GridSearchCV and returns the best model."""
+    """
+    Performs hyperparameter tuning using GridSearchCV on all cores and returns
+    the best model.
+    """
     grid_search = GridSearchCV(
-        model, param_grid=param_grid, cv=5, scoring="recall", verbose=4
+        model, param_grid=param_grid, cv=5, scoring="recall", verbose=4, n_jobs=-1
     )
     grid_search.fit(X_train, y_train)
     print("Best score:", grid_search.best_score_)
@@ -70,21 +77,75 @@ def tune_hyperparameters(model, param_grid, X_train, y_train):
     return grid_search.best_params_
 
 
-best_params = tune_hyperparameters(model, param_grid, X_train, y_train)
-
-
 # Training Random Forest Model with Optimal Parameters
 def train_model(X_train, y_train, best_params):
-    """Trains a Random Forest model using the best hyperparameters."""
-    rf = RandomForestClassifier(**best_params, random_state=2)
+    """
+    Trains a Random Forest model using the best hyperparameters, fitting trees
+    on all cores.
+    """
+    rf = RandomForestClassifier(**best_params, random_state=2, n_jobs=-1)
     rf.fit(X_train, y_train)
     return rf
 
 
-rf = train_model(X_train, y_train, best_params)
-
-# Making Predictions
-y_pred = rf.predict(X_test)
+# Tuning and training, reusing a cached model when the data has not changed
+def _model_metadata(X_train, y_train):
+    """
+    Describes what a cached model was trained on, to decide whether it can be
+    reused: a hash of the training data and PARAM_GRID, and the scikit-learn
+    version that fitted it.
+    """
+    return {
+        "data_hash": joblib.hash((X_train, y_train, PARAM_GRID)),
+        "sklearn_version": sklearn.__version__,
+    }
+
+
+def train_rf(X_train, y_train, model_path=MODEL_PATH):
+    """
+    Tunes and trains the Random Forest, or loads it from model_path if the
+    saved model was trained on the same training data and PARAM_GRID with the
+    installed scikit-learn version.
+
+    Args:
+        X_train (pd.DataFrame): Training features.
+        y_train (pd.Series): Training target.
+        model_path (str, optional): Path of the cached model; None disables caching.
+
+    Returns:
+        RandomForestClassifier: The trained model.
+    """
+    if model_path is not None:
+        metadata = _model_metadata(X_train, y_train)
+        try:
+            cached = joblib.load(model_path)
+        except (
+            OSError,
+            EOFError,
+            ValueError,
+            KeyError,
+            ImportError,
+            AttributeError,
+            pickle.UnpicklingError,
+        ):
+            # Missing, truncated or incompatible (e.g. other scikit-learn) file
+            cached = None
+        if isinstance(cached, dict) and cached.get("metadata") == metadata:
+            print(f"Loading cached model from {model_path}")
+            return cached["model"]
+
+    # Creating a Random Forest Classifier; trees are fit on a single core each
+    # while GridSearchCV parallelizes across candidates and folds
+    model = RandomForestClassifier(random_state=2, n_jobs=1)
+
+    best_params = tune_hyperparameters(model, PARAM_GRID, X_train, y_train)
+    rf = train_model(X_train, y_train, best_params)
+
+    if model_path is not None:
+        os.makedirs(os.path.dirname(model_path) or ".", exist_ok=True)
+        joblib.dump({"model": rf, "metadata": metadata}, model_path, compress=3)
+        print(f"Model saved to {model_path}")
+    return rf
 
 
 # Model Evaluation
@@ -96,4 +157,37 @@ def evaluate_model(y_test, y_pred):
     print("F2 Score:", fbeta_score(y_test, y_pred, beta=2))
 
 
-evaluate_model(y_test, y_pred)
+def main(data_path="data/processed_credit_data.csv", model_path=MODEL_PATH):
+    """Runs the full modeling pipeline on the processed credit data."""
+    # Read data (from its Parquet copy when fresh), parsing the columns to
+    # encode straight into categoricals so get_dummies works from their codes
+    data = load_data(data_path, dtype=dict.fromkeys(CATEGORICAL_COLUMNS, "category"))
+    print("Columns in dataset:", data.columns)  # Print column names for verification
+
+    # One-Hot Encoding of Categorical Features
+    data = pd.get_dummies(
+        data, columns=CATEGORICAL_COLUMNS, drop_first=True
+    )  # Prevent dummy variable trap
+
+    data = create_target_column(data)
+
+    # Splitting dataset into features (X) and target (y)
+    X = data.drop(columns=["good_credit"])  # Feature matrix
+    y = data["good_credit"]  # Target column
+
+    # Split the dataset into training and test sets
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=0.2, random_state=42
+    )
+
+    rf = train_rf(X_train, y_train, model_path)
+
+    # Making Predictions
+    y_pred = rf.predict(X_test)
+
+    evaluate_model(y_test, y_pred)
+    return rf
+
+
+if __name__ == "__main__":
+    main()
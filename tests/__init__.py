@@ -0,0 +1,3 @@
+# SPDX-FileCopyrightText: 2025-present Zhiying Zhang <zhiying_zhang@outlook.com>
+#
+# SPDX-License-Identifier: MIT
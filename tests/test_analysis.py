@@ -0,0 +1,231 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pygroupf.analysis import DataAnalyzer
+
+# Scoring configuration used in the tutorial
+SCORING_RULES = {
+    "Age": [
+        {"condition": lambda x: x < 20 or x > 70, "score": 15},
+        {"condition": lambda x: 20 <= x < 25 or 60 < x <= 70, "score": 10},
+        {"condition": lambda x: 25 <= x < 30 or 50 < x <= 60, "score": 5},
+    ],
+    "Sex": {"male": 2, "female": 0, "unknown": 1},
+    "Job": {0: 15, 1: 10, 2: 5, 3: 1},
+    "Housing": {0: 15, 1: 10, 2: 5},
+    "Saving accounts": {
+        "default": lambda x: (4 - x) * 3 if x > 0 else 10,
+        "specific": {0: 10},
+    },
+    "Checking account": {
+        "default": lambda x: (3 - x) * 4 if x > 0 else 10,
+        "specific": {0: 10},
+    },
+    "Credit amount": [
+        {"threshold": 8000, "score": 15},
+        {"threshold": 5000, "score": 10},
+        {"threshold": 2000, "score": 5},
+    ],
+    "Duration": [
+        {"threshold": 36, "score": 15},
+        {"threshold": 24, "score": 10},
+        {"threshold": 12, "score": 5},
+    ],
+    "Purpose": {"business": 10, "education": 10, "car": 5, "radio/TV": 3},
+}
+
+RISK_LEVELS = [
+    (70, "High risk"),
+    (50, "Medium-high risk"),
+    (30, "Medium-low risk"),
+    (0, "Low risk"),
+]
+
+
+def make_data(n=200, seed=0):
+    """Build random credit data with the columns scored by SCORING_RULES."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "age": rng.integers(18, 80, n),
+            "sex": rng.choice(["male", "female", "unknown"], n),
+            "job": rng.integers(0, 5, n),
+            "housing": rng.integers(-1, 3, n),
+            "saving_accounts": rng.integers(0, 5, n),
+            "checking_account": rng.integers(0, 4, n),
+            "credit_amount": rng.integers(250, 15000, n),
+            "duration": rng.integers(4, 72, n),
+            "purpose": rng.choice(["business", "car", "radio/TV", "repairs"], n),
+        }
+    )
+
+
+def with_nans(data):
+    """Float columns with missing values, plus missing categories."""
+    data = data.astype({"age": float, "saving_accounts": float, "duration": float})
+    data.loc[::7, "age"] = np.nan
+    data.loc[::5, "saving_accounts"] = np.nan
+    data.loc[::9, "duration"] = np.nan
+    data["purpose"] = data["purpose"].astype(object)
+    data.loc[::11, "purpose"] = None
+    return data
+
+
+def as_int8(data):
+    """Downcast integer columns to int8 (and int16 where needed)."""
+    return data.astype(
+        {
+            "age": np.int8,
+            "job": np.int8,
+            "housing": np.int8,
+            "saving_accounts": np.int8,
+            "checking_account": np.int8,
+            "duration": np.int8,
+            "credit_amount": np.int16,
+        }
+    )
+
+
+def as_float(data):
+    """Store every numeric column as float64."""
+    return data.astype({col: float for col in data.select_dtypes("number").columns})
+
+
+def as_categorical(data):
+    """Store the string columns as pandas categoricals."""
+    return data.astype({"sex": "category", "purpose": "category"})
+
+
+# Hand-scored rows: (age, sex, job, housing, saving_accounts,
+# checking_account, credit_amount, duration, purpose), score, level
+SCORED_ROWS = [
+    ((67, "male", 2, 2, 0, 1, 1169, 6, "radio/TV"), 43, "Medium-low risk"),
+    ((22, "female", 0, 0, 4, 3, 9000, 48, "business"), 80, "High risk"),
+    ((35, "unknown", 3, 1, 2, 0, 5000, 24, "repairs"), 38, "Medium-low risk"),
+    ((19, "male", 1, 0, 1, 1, 8001, 37, "education"), 99, "High risk"),
+    ((30, "female", 4, -1, 3, 2, 100, 12, "car"), 12, "Low risk"),
+    ((75, "male", 0, 0, 0, 0, 9000, 40, "business"), 100, "High risk"),
+]
+
+
+def test_report_matches_hand_scored_rows():
+    columns = [
+        "age",
+        "sex",
+        "job",
+        "housing",
+        "saving_accounts",
+        "checking_account",
+        "credit_amount",
+        "duration",
+        "purpose",
+    ]
+    data = pd.DataFrame([row for row, _, _ in SCORED_ROWS], columns=columns)
+
+    report = DataAnalyzer(data, SCORING_RULES, RISK_LEVELS).generate_risk_report()
+
+    assert report["risk_score"].tolist() == [score for _, score, _ in SCORED_ROWS]
+    assert report["risk_level"].tolist() == [level for _, _, level in SCORED_ROWS]
+
+
+@pytest.mark.parametrize(
+    "transform",
+    [lambda data: data, with_nans, as_int8, as_float, as_categorical],
+    ids=["int64", "nan", "int8", "float", "categorical"],
+)
+def test_report_matches_scalar_scoring(transform):
+    data = transform(make_data())
+    analyzer = DataAnalyzer(data, SCORING_RULES, RISK_LEVELS)
+
+    report = analyzer.generate_risk_report()
+
+    expected_scores = [analyzer.calculate_risk_score(row) for _, row in data.iterrows()]
+    expected_levels = [analyzer.determine_risk_level(s) for s in expected_scores]
+    assert report["risk_score"].tolist() == expected_scores
+    assert report["risk_level"].tolist() == expected_levels
+    assert report["customer_id"].tolist() == list(range(1, len(data) + 1))
+
+
+def test_report_leaves_data_untouched():
+    data = make_data()
+    original = data.copy()
+
+    DataAnalyzer(data, SCORING_RULES, RISK_LEVELS).generate_risk_report()
+
+    pd.testing.assert_frame_equal(data, original)
+
+
+def test_risk_levels_keep_their_type():
+    analyzer = DataAnalyzer(make_data(), SCORING_RULES, [(70, 3), (50, 2), (30, 1)])
+
+    assert analyzer.determine_risk_level(80) == 3
+    assert analyzer.determine_risk_level(10) == "Unknown"
+    assert analyzer.determine_risk_level(np.nan) == "Unknown"
+
+
+@pytest.mark.parametrize("transform", [lambda data: data, with_nans, as_int8])
+def test_risk_score_dtype_is_fixed(transform):
+    report = DataAnalyzer(
+        transform(make_data()), SCORING_RULES, RISK_LEVELS
+    ).generate_risk_report()
+
+    assert report["risk_score"].dtype == np.int64
+    assert (report["risk_score"] * 2).max() == 2 * report["risk_score"].max()
+
+
+def test_risk_level_dtype_is_fixed():
+    data = make_data()
+    analyzer = DataAnalyzer(data, SCORING_RULES, RISK_LEVELS)
+
+    full = analyzer.generate_risk_report()
+    low = full[full["risk_level"] == "Low risk"]
+
+    expected = [level for _, level in RISK_LEVELS] + ["Unknown"]
+    assert list(full["risk_level"].cat.categories) == expected
+    combined = pd.concat([full, low])
+    assert isinstance(combined["risk_level"].dtype, pd.CategoricalDtype)
+
+
+def test_reassigned_rules_and_levels_are_used():
+    data = make_data(n=20)
+    analyzer = DataAnalyzer(data, SCORING_RULES, RISK_LEVELS)
+    analyzer.generate_risk_report()
+
+    analyzer.scoring_rules = {"Job": {0: 100}}
+    analyzer.risk_levels = [(0, "X")]
+    report = analyzer.generate_risk_report()
+
+    assert report["risk_score"].tolist() == [100 if j == 0 else 0 for j in data["job"]]
+    assert set(report["risk_level"]) == {"X"}
+    assert analyzer.determine_risk_level(50) == "X"
+    assert analyzer.calculate_field_score("Job", 0) == 100
+
+
+def test_bool_keyed_rules():
+    data = pd.DataFrame({"flag": [True, False, True]})
+    analyzer = DataAnalyzer(data, {"Flag": {True: 5, False: 1}}, RISK_LEVELS)
+
+    report = analyzer.generate_risk_report()
+
+    assert report["risk_score"].tolist() == [5, 1, 5]
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+def test_save_risk_report(tmp_path, suffix):
+    if suffix == ".parquet":
+        pytest.importorskip("pyarrow")
+    analyzer = DataAnalyzer(make_data(n=20), SCORING_RULES, RISK_LEVELS)
+    output_path = str(tmp_path / f"risk_report{suffix}")
+
+    analyzer.save_risk_report(output_path)
+
+    if suffix == ".parquet":
+        saved = pd.read_parquet(output_path)
+    else:
+        saved = pd.read_csv(output_path)
+    expected = analyzer.generate_risk_report()
+    assert saved["risk_score"].tolist() == expected["risk_score"].tolist()
+    assert saved["risk_level"].astype(str).tolist() == (
+        expected["risk_level"].astype(str).tolist()
+    )
@@ -0,0 +1,210 @@
+import datetime
+import io
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pygroupf.data_processing import (
+    _PYARROW_CSV,
+    CREDIT_DTYPES,
+    DataEncoder,
+    clean_data,
+    load_data,
+    save_processed_data,
+)
+
+CSV_TEXT = ",Age,Sex,Credit amount\n0,67,male,1169\n1,22,female,5951\n"
+
+
+def test_load_data_drops_index_and_standardizes_columns(tmp_path):
+    path = tmp_path / "credit.csv"
+    path.write_text(CSV_TEXT)
+
+    data = load_data(path)
+
+    assert list(data.columns) == ["age", "sex", "credit_amount"]
+    assert data["credit_amount"].tolist() == [1169, 5951]
+
+
+@pytest.mark.parametrize("index", ["", "0,"], ids=["no_index", "index"])
+def test_load_data_handles_repeated_names(tmp_path, index):
+    path = tmp_path / "repeated.csv"
+    header = "," if index else ""
+    path.write_text(f"{header}a,a,b\n{index}1,2,x\n")
+
+    data = load_data(path)
+
+    assert list(data.columns) == ["a", "a.1", "b"]
+    assert data.iloc[0].tolist() == [1, 2, "x"]
+
+
+def test_load_data_accepts_buffers():
+    data = load_data(io.StringIO(CSV_TEXT))
+
+    assert list(data.columns) == ["age", "sex", "credit_amount"]
+    assert data["credit_amount"].tolist() == [1169, 5951]
+
+
+def test_load_data_accepts_path_objects(tmp_path):
+    pytest.importorskip("pyarrow")
+    csv_path = tmp_path / "credit.csv"
+    csv_path.write_text(CSV_TEXT)
+    pd.DataFrame({"age": [30]}).to_parquet(tmp_path / "credit.parquet")
+
+    # Paths are resolved once, so pathlib paths find the Parquet copy too
+    assert load_data(csv_path)["age"].tolist() == [30]
+
+
+def test_load_data_date_inference(tmp_path):
+    path = tmp_path / "dates.csv"
+    path.write_text("date,v\n2020-01-01,1\n")
+
+    # The pyarrow engine parses ISO dates; the C parser leaves them as text
+    expected = datetime.date(2020, 1, 1) if _PYARROW_CSV else "2020-01-01"
+    assert load_data(path)["date"][0] == expected
+
+    # An explicit dtype keeps them as strings with either engine
+    assert load_data(path, dtype={"date": str})["date"][0] == "2020-01-01"
+
+
+def test_load_data_prefers_fresh_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    csv_path = tmp_path / "credit.csv"
+    parquet_path = tmp_path / "credit.parquet"
+    csv_path.write_text("age,sex\n67,male\n")
+    pd.DataFrame({"age": [30], "sex": ["female"]}).to_parquet(parquet_path)
+
+    # Parquet copy newer than the CSV: it is read instead
+    os.utime(csv_path, (1_000_000, 1_000_000))
+    os.utime(parquet_path, (2_000_000, 2_000_000))
+    assert load_data(csv_path)["age"].tolist() == [30]
+
+    # Stale Parquet copy: the CSV is read
+    os.utime(parquet_path, (500_000, 500_000))
+    assert load_data(csv_path)["age"].tolist() == [67]
+
+
+def test_clean_data_fills_missing_values():
+    data = pd.DataFrame(
+        {
+            "age": ["67", "22", "49"],
+            "duration": [6.0, None, 12.0],
+            "purpose": ["car", None, "car"],
+        }
+    )
+
+    cleaned = clean_data(data, ["Purpose"], ["Age", "Duration"])
+
+    assert cleaned["age"].tolist() == [67, 22, 49]
+    assert cleaned["age"].dtype == np.int64
+    assert cleaned["duration"].tolist() == [6.0, 9.0, 12.0]
+    assert cleaned["purpose"].tolist() == ["car", "unknown", "car"]
+    assert isinstance(cleaned["purpose"].dtype, pd.CategoricalDtype)
+
+
+def test_clean_data_keeps_dtypes_unless_requested():
+    # Columns named like the credit data are not narrowed implicitly
+    data = pd.DataFrame({"duration": [40000, 10], "credit_amount": [1169, 5951]})
+
+    cleaned = clean_data(data, [], ["Duration", "Credit amount"])
+
+    assert cleaned["duration"].tolist() == [40000, 10]
+    assert cleaned["duration"].dtype == np.int64
+    assert cleaned["credit_amount"].dtype == np.int64
+
+
+def test_clean_data_applies_requested_dtypes():
+    data = pd.DataFrame({"age": [67, 22], "credit_amount": [1169, 5951]})
+
+    cleaned = clean_data(data, [], ["Age", "Credit amount"], dtypes=CREDIT_DTYPES)
+
+    assert cleaned["age"].dtype == np.int16
+    assert cleaned["credit_amount"].dtype == np.int32
+
+
+def test_clean_data_rejects_out_of_range_values():
+    data = pd.DataFrame({"duration": [40000, 10]})
+
+    with pytest.raises(AssertionError, match="do not fit"):
+        clean_data(data, [], ["Duration"], dtypes={"Duration": "int16"})
+
+
+def test_encoder_maps_values():
+    encoder = DataEncoder({"Sex": {"male": 1, "female": 0}})
+    data = pd.DataFrame({"sex": ["male", "female", "male"]})
+
+    encoded = encoder.encode(data)
+
+    assert encoded["sex"].tolist() == [1, 0, 1]
+
+
+def test_encoder_unmapped_values_become_nan():
+    mapping = {"male": 1, "female": 0}
+    data = pd.DataFrame({"sex": ["male", "other", None, "female"]})
+    expected = data["sex"].map(mapping)
+
+    encoded = DataEncoder({"Sex": mapping}).encode(data)
+
+    pd.testing.assert_series_equal(encoded["sex"], expected)
+
+
+def test_encoder_gathers_compact_codes():
+    mapping = {"little": 0, "moderate": 1, "rich": 2}
+    data = pd.DataFrame({"saving_accounts": ["rich", "little", "moderate", "rich"]})
+
+    encoded = DataEncoder({"Saving accounts": mapping}).encode(data)
+
+    assert encoded["saving_accounts"].tolist() == [2, 0, 1, 2]
+    assert encoded["saving_accounts"].dtype == np.int8
+
+
+def test_encoder_uses_reassigned_mapping():
+    encoder = DataEncoder({"Sex": {"male": 1, "female": 0}})
+
+    encoder.column_mapping = {"Housing": {"own": 2, "rent": 3}}
+    encoded = encoder.encode(pd.DataFrame({"sex": ["male"], "housing": ["rent"]}))
+
+    assert encoded["sex"].tolist() == ["male"]
+    assert encoded["housing"].tolist() == [3]
+
+
+def test_save_processed_data_round_trips(tmp_path):
+    data = pd.DataFrame({"age": [67, 22], "purpose": ["car", "business"]})
+
+    output_path = save_processed_data(data, output_dir=tmp_path)
+
+    assert output_path == os.path.join(tmp_path, "processed_credit_data.csv")
+    pd.testing.assert_frame_equal(load_data(output_path), data, check_dtype=False)
+
+
+def test_save_processed_data_skips_unwritable_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    parquet_path = tmp_path / "processed_credit_data.parquet"
+    save_processed_data(pd.DataFrame({"age": [1]}), output_dir=tmp_path)
+    assert parquet_path.exists()
+
+    # Mixed ints and strings in a categorical cannot be stored as Parquet
+    data = clean_data(pd.DataFrame({"code": [1, "a", None, 2]}), ["code"], [])
+    output_path = save_processed_data(data, output_dir=tmp_path)
+
+    assert os.path.exists(output_path)
+    assert not parquet_path.exists()
+    assert load_data(output_path)["code"].astype(str).tolist() == [
+        "1",
+        "a",
+        "unknown",
+        "2",
+    ]
+
+
+def test_save_processed_data_parquet_only(tmp_path):
+    pytest.importorskip("pyarrow")
+    data = pd.DataFrame({"age": [67, 22], "purpose": ["car", "business"]})
+
+    output_path = save_processed_data(data, output_dir=tmp_path, file_format="parquet")
+
+    assert output_path == os.path.join(tmp_path, "processed_credit_data.parquet")
+    assert not (tmp_path / "processed_credit_data.csv").exists()
+    pd.testing.assert_frame_equal(pd.read_parquet(output_path), data)
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pygroupf import modeling
+
+BEST_PARAMS = {"n_estimators": 3, "max_depth": 2}
+
+
+@pytest.fixture
+def tuning_calls(monkeypatch):
+    # Skip the grid search: record each tuning run and return fixed parameters
+    calls = []
+
+    def tune(model, param_grid, X_train, y_train):
+        calls.append(param_grid)
+        return BEST_PARAMS
+
+    monkeypatch.setattr(modeling, "tune_hyperparameters", tune)
+    return calls
+
+
+def make_training_data(n=40):
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(
+        {"age": rng.integers(19, 75, n), "duration": rng.integers(4, 72, n)}
+    )
+    y = pd.Series((X["age"] > 40).astype(np.int8), name="good_credit")
+    return X, y
+
+
+def test_cached_model_is_reused(tmp_path, tuning_calls):
+    model_path = str(tmp_path / "rf_model.joblib")
+    X, y = make_training_data()
+
+    first = modeling.train_rf(X, y, model_path)
+    second = modeling.train_rf(X, y, model_path)
+
+    assert len(tuning_calls) == 1
+    np.testing.assert_array_equal(first.predict(X), second.predict(X))
+
+
+def test_cached_model_is_retrained_when_inputs_change(
+    tmp_path, tuning_calls, monkeypatch
+):
+    model_path = str(tmp_path / "rf_model.joblib")
+    X, y = make_training_data()
+    modeling.train_rf(X, y, model_path)
+
+    # Same shape and columns, different values
+    modeling.train_rf(X, 1 - y, model_path)
+    assert len(tuning_calls) == 2
+
+    monkeypatch.setattr(modeling, "PARAM_GRID", {"max_depth": [2]})
+    modeling.train_rf(X, 1 - y, model_path)
+    assert len(tuning_calls) == 3
+
+
+def test_unreadable_cache_is_retrained(tmp_path, tuning_calls):
+    model_path = tmp_path / "rf_model.joblib"
+    model_path.write_bytes(b"not a joblib file")
+    X, y = make_training_data()
+
+    rf = modeling.train_rf(X, y, str(model_path))
+
+    assert len(tuning_calls) == 1
+    assert rf.predict(X).shape == (len(X),)
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pygroupf.analysis import DataAnalyzer
+from pygroupf.visualization import DataVisualizer
+from tests.test_analysis import RISK_LEVELS, SCORING_RULES, make_data
+
+
+@pytest.fixture
+def report():
+    # The heatmap also encodes job and the risk level
+    data = make_data(n=300, seed=1)
+    return DataAnalyzer(data, SCORING_RULES, RISK_LEVELS).generate_risk_report()
+
+
+@pytest.fixture(autouse=True)
+def image_dir(tmp_path, monkeypatch):
+    # Plots are written under ./image
+    monkeypatch.chdir(tmp_path)
+
+
+def test_heatmap_correlations_match_csv(report, tmp_path):
+    report.to_csv(tmp_path / "report.csv", index=False)
+
+    from_memory = DataVisualizer(report)._correlation_matrix()
+    from_csv = DataVisualizer(tmp_path / "report.csv")._correlation_matrix()
+
+    pd.testing.assert_frame_equal(from_memory, from_csv)
+
+
+def test_risk_distribution_skips_missing_levels(report, tmp_path):
+    low = report[report["risk_level"].isin(["Low risk", "Medium-low risk"])]
+    low.to_csv(tmp_path / "low.csv", index=False)
+
+    plots = [
+        DataVisualizer(low).plot_risk_distribution(),
+        DataVisualizer(tmp_path / "low.csv").plot_risk_distribution(),
+    ]
+
+    expected = low["risk_level"].astype(str).value_counts().sort_index()
+    for ax in plots:
+        labels = [tick.get_text() for tick in ax.get_xticklabels()]
+        heights = [patch.get_height() for patch in ax.patches]
+        assert labels == list(expected.index)
+        assert np.array_equal(heights, expected.to_numpy())
+    assert (tmp_path / "image" / "risk_distribution.png").exists()
+
+
+def test_visualizer_uses_dataframe_as_is(report, tmp_path):
+    visualizer = DataVisualizer(report)
+
+    assert visualizer.data is report
+    visualizer.plot_heatmap()
+    assert (tmp_path / "image" / "heatmap.png").exists()
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2, -1, -2])
+def test_visualize_all_saves_every_plot(report, tmp_path, n_jobs):
+    DataVisualizer(report).visualize_all(n_jobs=n_jobs)
+
+    assert (tmp_path / "image" / "heatmap.png").exists()
+    assert (tmp_path / "image" / "risk_distribution.png").exists()
+
+
+@pytest.mark.parametrize("n_jobs", [0, 1.5, True])
+def test_visualize_all_rejects_invalid_n_jobs(report, n_jobs):
+    with pytest.raises(AssertionError, match="n_jobs"):
+        DataVisualizer(report).visualize_all(n_jobs=n_jobs)